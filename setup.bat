@@ -5,7 +5,7 @@ echo =========================================
 echo.
 
 echo [1/2] Installing Node.js dependencies...
-call npm install
+call npm ci --no-audit --no-fund --prefer-offline
 if %ERRORLEVEL% NEQ 0 (
     echo Error installing dependencies.
     pause
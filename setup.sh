@@ -9,7 +9,9 @@ echo "========================================="
 echo ""
 
 echo "[1/2] Installing Node.js dependencies..."
-npm install
+# npm ci installs straight from the lockfile (no resolver pass); the flags
+# skip the audit/funding network calls and reuse the local cache first.
+npm ci --no-audit --no-fund --prefer-offline
 
 echo ""
 echo "[2/2] Installing Playwright Chromium browser..."
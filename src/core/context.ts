@@ -17,6 +17,23 @@ interface ContextOptions {
   storageStatePath: string;
 }
 
+// Launch options are identical for every context, so the object (and its args
+// array) is built once at load and frozen rather than reassembled per launch.
+const LAUNCH_OPTIONS = Object.freeze({
+  headless: config.headless,
+  slowMo: config.slowMo,
+  acceptDownloads: true,
+  downloadsPath: config.downloadsDir,
+  viewport: { width: 1365, height: 768 },
+  args: [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-infobars",
+  ],
+  ignoreDefaultArgs: ["--enable-automation"],
+});
+
 export async function createPersistentContext(
   options: ContextOptions,
 ): Promise<BrowserContext> {
@@ -27,20 +44,10 @@ export async function createPersistentContext(
   log.info(`Launching persistent context: ${options.profileDir}`);
   log.info(`Headless=${config.headless}, slowMo=${config.slowMo}`);
 
-  const context = await chromium.launchPersistentContext(options.profileDir, {
-    headless: config.headless,
-    slowMo: config.slowMo,
-    acceptDownloads: true,
-    downloadsPath: config.downloadsDir,
-    viewport: { width: 1365, height: 768 },
-    args: [
-      "--disable-blink-features=AutomationControlled",
-      "--no-sandbox",
-      "--disable-setuid-sandbox",
-      "--disable-infobars",
-    ],
-    ignoreDefaultArgs: ["--enable-automation"],
-  });
+  const context = await chromium.launchPersistentContext(
+    options.profileDir,
+    LAUNCH_OPTIONS,
+  );
 
   context.setDefaultTimeout(60_000);
   context.setDefaultNavigationTimeout(60_000);
@@ -48,6 +55,51 @@ export async function createPersistentContext(
   return context;
 }
 
+// -----------------------------------------------------
+// Shared warm context across module runs
+// -----------------------------------------------------
+// Launching Chromium dominates module start-up time, and two modules opening
+// the same persistent profile concurrently would fight over the profile lock.
+// Sequential (and overlapping) module runs therefore borrow one warm shared
+// context instead of relaunching per run.
+
+let sharedContext: BrowserContext | null = null;
+// In-flight launch shared by concurrent acquirers: two overlapping module
+// starts await the same promise instead of double-launching Chromium (and
+// deadlocking on the profile lock).
+let sharedContextLaunch: Promise<BrowserContext> | null = null;
+
+export async function acquireSharedContext(
+  options: ContextOptions,
+): Promise<BrowserContext> {
+  if (sharedContext) return sharedContext;
+
+  if (!sharedContextLaunch) {
+    sharedContextLaunch = createPersistentContext(options)
+      .then((ctx) => {
+        sharedContext = ctx;
+        // If the browser dies or is closed externally, the next acquire
+        // relaunches.
+        ctx.on("close", () => {
+          sharedContext = null;
+        });
+        return ctx;
+      })
+      .finally(() => {
+        sharedContextLaunch = null;
+      });
+  }
+  return sharedContextLaunch;
+}
+
+export async function closeSharedContext(): Promise<void> {
+  if (sharedContext) {
+    const ctx = sharedContext;
+    sharedContext = null;
+    await ctx.close().catch(() => {});
+  }
+}
+
 export async function saveStorageState(
   context: BrowserContext,
   storagePath: string,
@@ -8,6 +8,12 @@ class Database {
   constructor() {
     this.pool = new Pool({
       connectionString: config.databaseUrl,
+      // The database is remote (Neon), so connection setup costs a TLS
+      // handshake. Keep-alives and a longer idle timeout let hot loops and
+      // concurrent workers reuse warm connections instead of renegotiating.
+      max: 10,
+      keepAlive: true,
+      idleTimeoutMillis: 30_000,
     });
 
     this.pool.on("error", (err, client) => {
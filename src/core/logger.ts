@@ -1,8 +1,34 @@
+import { config } from "../config";
+
+const LEVELS = { info: 0, warn: 1, error: 2 } as const;
+
+// Resolved once at load; filtered calls return before any timestamp
+// formatting or console write happens.
+const threshold = LEVELS[config.logLevel] ?? LEVELS.info;
+
+// ISO timestamps only carry millisecond precision, so bursts of log lines in
+// the same millisecond reuse the formatted string instead of re-allocating a
+// Date and re-serializing it per call.
+let lastMs = -1;
+let lastIso = "";
+
+function nowIso(): string {
+  const ms = Date.now();
+  if (ms !== lastMs) {
+    lastMs = ms;
+    lastIso = new Date(ms).toISOString();
+  }
+  return lastIso;
+}
+
 export const log = {
-  info: (msg: string) =>
-    console.error(`[INFO] ${new Date().toISOString()} ${msg}`),
-  warn: (msg: string) =>
-    console.warn(`[WARN] ${new Date().toISOString()} ${msg}`),
-  error: (msg: string) =>
-    console.error(`[ERROR] ${new Date().toISOString()} ${msg}`),
+  info: (msg: string) => {
+    if (threshold > LEVELS.info) return;
+    console.error(`[INFO] ${nowIso()} ${msg}`);
+  },
+  warn: (msg: string) => {
+    if (threshold > LEVELS.warn) return;
+    console.warn(`[WARN] ${nowIso()} ${msg}`);
+  },
+  error: (msg: string) => console.error(`[ERROR] ${nowIso()} ${msg}`),
 };
@@ -26,200 +26,223 @@ const server = new Server(
 
 /**
  * Ensures the global browser profile is running before executing tools.
+ * Concurrent tool calls share one in-flight launch rather than racing the
+ * null check and double-launching the profile.
  */
+let browserLaunch: Promise<void> | null = null;
+
 async function ensureBrowserReady() {
   if (!globalContext) {
-    globalContext = await createPersistentContext({
-      profileDir: config.profileDir,
-      storageStatePath: config.storageStatePath,
-    });
-    activePage =
-      globalContext.pages().length > 0
-        ? globalContext.pages()[0]
-        : await globalContext.newPage();
+    if (!browserLaunch) {
+      browserLaunch = (async () => {
+        const context = await createPersistentContext({
+          profileDir: config.profileDir,
+          storageStatePath: config.storageStatePath,
+        });
+        activePage =
+          context.pages().length > 0
+            ? context.pages()[0]
+            : await context.newPage();
+        globalContext = context;
+      })().finally(() => {
+        browserLaunch = null;
+      });
+    }
+    await browserLaunch;
   }
-  return { context: globalContext, page: activePage! };
+  return { context: globalContext!, page: activePage! };
 }
 
 /**
- * Register the exposed AI Playwright Tools
+ * The exposed AI Playwright Tools. The schemas are static, so the list is
+ * built once at module load instead of on every ListTools request.
  */
-server.setRequestHandler(ListToolsRequestSchema, async () => {
-  return {
-    tools: [
-      {
-        name: "winky_navigate",
-        description: "Navigate the shared Winky browser to a specific URL",
-        inputSchema: {
-          type: "object",
-          properties: {
-            url: { type: "string", description: "The full URL to visit." },
-          },
-          required: ["url"],
-        },
-      },
-      {
-        name: "winky_evaluate",
-        description:
-          "Run JavaScript on the current page to inspect the DOM or test selectors.",
-        inputSchema: {
-          type: "object",
-          properties: {
-            script: {
-              type: "string",
-              description:
-                "JavaScript code to evaluate. It is wrapped in an async function.",
-            },
-          },
-          required: ["script"],
-        },
-      },
-      {
-        name: "winky_get_html",
-        description: "Returns the outer HTML of the current body tag.",
-        inputSchema: {
-          type: "object",
-          properties: {},
-        },
-      },
-      {
-        name: "winky_click",
-        description: "Click an element matching the given query selector.",
-        inputSchema: {
-          type: "object",
-          properties: {
-            selector: { type: "string" },
-          },
-          required: ["selector"],
-        },
-      },
-      {
-        name: "winky_type",
-        description: "Type text into an input field matching a selector.",
-        inputSchema: {
-          type: "object",
-          properties: {
-            selector: { type: "string" },
-            text: { type: "string" },
-          },
-          required: ["selector", "text"],
-        },
+const TOOLS = [
+  {
+    name: "winky_navigate",
+    description: "Navigate the shared Winky browser to a specific URL",
+    inputSchema: {
+      type: "object",
+      properties: {
+        url: { type: "string", description: "The full URL to visit." },
       },
-      {
-        name: "winky_save_state",
-        description:
-          "Saves the current session cookies into Winky's global storageState manually.",
-        inputSchema: {
-          type: "object",
-          properties: {},
+      required: ["url"],
+    },
+  },
+  {
+    name: "winky_evaluate",
+    description:
+      "Run JavaScript on the current page to inspect the DOM or test selectors.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        script: {
+          type: "string",
+          description:
+            "JavaScript code to evaluate. It is wrapped in an async function.",
         },
       },
-      {
-        name: "winky_reload",
-        description: "Reloads the current active page in the Winky browser.",
-        inputSchema: {
-          type: "object",
-          properties: {},
-        },
+      required: ["script"],
+    },
+  },
+  {
+    name: "winky_get_html",
+    description: "Returns the outer HTML of the current body tag.",
+    inputSchema: {
+      type: "object",
+      properties: {},
+    },
+  },
+  {
+    name: "winky_click",
+    description: "Click an element matching the given query selector.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        selector: { type: "string" },
       },
-      {
-        name: "winky_close",
-        description:
-          "Closes the current page and shuts down the active Winky browser profile entirely.",
-        inputSchema: {
-          type: "object",
-          properties: {},
-        },
+      required: ["selector"],
+    },
+  },
+  {
+    name: "winky_type",
+    description: "Type text into an input field matching a selector.",
+    inputSchema: {
+      type: "object",
+      properties: {
+        selector: { type: "string" },
+        text: { type: "string" },
       },
-    ],
-  };
+      required: ["selector", "text"],
+    },
+  },
+  {
+    name: "winky_save_state",
+    description:
+      "Saves the current session cookies into Winky's global storageState manually.",
+    inputSchema: {
+      type: "object",
+      properties: {},
+    },
+  },
+  {
+    name: "winky_reload",
+    description: "Reloads the current active page in the Winky browser.",
+    inputSchema: {
+      type: "object",
+      properties: {},
+    },
+  },
+  {
+    name: "winky_close",
+    description:
+      "Closes the current page and shuts down the active Winky browser profile entirely.",
+    inputSchema: {
+      type: "object",
+      properties: {},
+    },
+  },
+];
+
+server.setRequestHandler(ListToolsRequestSchema, async () => {
+  return { tools: TOOLS };
 });
 
 /**
- * Route Tool Invocations
+ * Tool implementations, keyed by tool name. The table is built once at module
+ * load so invocation is a single lookup instead of a switch walked per call.
  */
-server.setRequestHandler(CallToolRequestSchema, async (request) => {
-  const { page, context } = await ensureBrowserReady();
+type ToolArgs = Record<string, unknown> | undefined;
 
-  try {
-    switch (request.params.name) {
-      case "winky_navigate": {
-        const url = String(request.params.arguments?.url);
-        await page.goto(url, { waitUntil: "domcontentloaded" });
-        return {
-          content: [{ type: "text", text: `Successfully navigated to ${url}` }],
-        };
-      }
+const TOOL_HANDLERS: Record<
+  string,
+  (args: ToolArgs, page: Page, context: BrowserContext) => Promise<any>
+> = {
+  winky_navigate: async (args, page) => {
+    const url = String(args?.url);
+    await page.goto(url, { waitUntil: "domcontentloaded" });
+    return {
+      content: [{ type: "text", text: `Successfully navigated to ${url}` }],
+    };
+  },
 
-      case "winky_evaluate": {
-        const script = String(request.params.arguments?.script);
-        const result = await page.evaluate(script);
-        return {
-          content: [{ type: "text", text: JSON.stringify(result, null, 2) }],
-        };
-      }
+  winky_evaluate: async (args, page) => {
+    const script = String(args?.script);
+    const result = await page.evaluate(script);
+    return {
+      content: [{ type: "text", text: JSON.stringify(result, null, 2) }],
+    };
+  },
 
-      case "winky_get_html": {
-        const html = await page.evaluate(() => document.body.outerHTML);
-        // Truncate if massive to protect context limits
-        const safeHtml =
-          html.length > 50000
-            ? html.substring(0, 50000) + "... [truncated]"
-            : html;
-        return {
-          content: [{ type: "text", text: safeHtml }],
-        };
-      }
+  winky_get_html: async (_args, page) => {
+    const html = await page.evaluate(() => document.body.outerHTML);
+    // Truncate if massive to protect context limits
+    const safeHtml =
+      html.length > 50000 ? html.substring(0, 50000) + "... [truncated]" : html;
+    return {
+      content: [{ type: "text", text: safeHtml }],
+    };
+  },
 
-      case "winky_click": {
-        const selector = String(request.params.arguments?.selector);
-        await page.click(selector);
-        return {
-          content: [{ type: "text", text: `Clicked ${selector}` }],
-        };
-      }
+  winky_click: async (args, page) => {
+    const selector = String(args?.selector);
+    await page.click(selector);
+    return {
+      content: [{ type: "text", text: `Clicked ${selector}` }],
+    };
+  },
 
-      case "winky_type": {
-        const selector = String(request.params.arguments?.selector);
-        const text = String(request.params.arguments?.text);
-        await page.fill(selector, text);
-        return {
-          content: [{ type: "text", text: `Typed "${text}" into ${selector}` }],
-        };
-      }
+  winky_type: async (args, page) => {
+    const selector = String(args?.selector);
+    const text = String(args?.text);
+    await page.fill(selector, text);
+    return {
+      content: [{ type: "text", text: `Typed "${text}" into ${selector}` }],
+    };
+  },
 
-      case "winky_save_state": {
-        await saveStorageState(context, config.storageStatePath);
-        return {
-          content: [
-            {
-              type: "text",
-              text: `Global storage state saved to ${config.storageStatePath}`,
-            },
-          ],
-        };
-      }
+  winky_save_state: async (_args, _page, context) => {
+    await saveStorageState(context, config.storageStatePath);
+    return {
+      content: [
+        {
+          type: "text",
+          text: `Global storage state saved to ${config.storageStatePath}`,
+        },
+      ],
+    };
+  },
 
-      case "winky_reload": {
-        await page.reload({ waitUntil: "domcontentloaded" });
-        return {
-          content: [{ type: "text", text: `Active page reloaded.` }],
-        };
-      }
+  winky_reload: async (_args, page) => {
+    await page.reload({ waitUntil: "domcontentloaded" });
+    return {
+      content: [{ type: "text", text: `Active page reloaded.` }],
+    };
+  },
 
-      case "winky_close": {
-        await saveStorageState(context, config.storageStatePath);
-        await context.close().catch(() => {});
-        globalContext = null;
-        activePage = null;
-        return {
-          content: [{ type: "text", text: `Browser profile closed securely.` }],
-        };
-      }
+  winky_close: async (_args, _page, context) => {
+    await saveStorageState(context, config.storageStatePath);
+    await context.close().catch(() => {});
+    globalContext = null;
+    activePage = null;
+    return {
+      content: [{ type: "text", text: `Browser profile closed securely.` }],
+    };
+  },
+};
 
-      default:
-        throw new Error(`Unknown Winky tool: ${request.params.name}`);
+/**
+ * Route Tool Invocations
+ */
+server.setRequestHandler(CallToolRequestSchema, async (request) => {
+  const { page, context } = await ensureBrowserReady();
+
+  try {
+    const handler = TOOL_HANDLERS[request.params.name];
+    if (!handler) {
+      throw new Error(`Unknown Winky tool: ${request.params.name}`);
     }
+    return await handler(request.params.arguments, page, context);
   } catch (error: any) {
     return {
       content: [
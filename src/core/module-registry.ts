@@ -0,0 +1,42 @@
+import fs from "node:fs";
+import path from "node:path";
+import { log } from "./logger";
+
+// Shared dynamic module registry for the TUI and the REST API.
+//
+// Modules are stateful singletons (they track their own isRunning flag), so
+// the directory scan and require() happen once and the resulting registry is
+// reused, instead of every caller re-walking src/modules per request.
+
+let cachedModules: Record<string, any> | null = null;
+
+export function getAvailableModules(): Record<string, any> {
+  if (cachedModules) return cachedModules;
+
+  const modulesPath = path.resolve(__dirname, "../modules");
+  const modules: Record<string, any> = {};
+
+  if (fs.existsSync(modulesPath)) {
+    const directories = fs
+      .readdirSync(modulesPath, { withFileTypes: true })
+      .filter((dirent) => dirent.isDirectory())
+      .map((dirent) => dirent.name);
+
+    for (const dirName of directories) {
+      const moduleIndexPath = path.join(modulesPath, dirName, "index.ts");
+      if (fs.existsSync(moduleIndexPath)) {
+        try {
+          const mod = require(moduleIndexPath);
+          if (mod.moduleConfig && mod.run) {
+            modules[mod.moduleConfig.name] = mod;
+          }
+        } catch (e) {
+          log.warn(`[Registry] Failed to load module inside ${dirName}: ${e}`);
+        }
+      }
+    }
+  }
+
+  cachedModules = modules;
+  return modules;
+}
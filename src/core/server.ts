@@ -2,65 +2,36 @@ import express from "express";
 import fs from "node:fs";
 import path from "node:path";
 import { log } from "./logger";
-import { config } from "../config";
+import { getAvailableModules } from "./module-registry";
+import { config, resolvedPaths } from "../config";
 
 const app = express();
 app.use(express.json());
 
 // Expose public static file access to the scraped outputs natively
-app.use(
-  "/public/downloads",
-  express.static(path.resolve(process.cwd(), config.downloadsDir)),
-);
-app.use(
-  "/public/screenshots",
-  express.static(path.resolve(process.cwd(), config.screenshotsDir)),
-);
-
-// Load modules dynamically for routing
-function getAvailableModules() {
-  const modulesPath = path.resolve(__dirname, "../modules");
-  if (!fs.existsSync(modulesPath)) return [];
-
-  const directories = fs
-    .readdirSync(modulesPath, { withFileTypes: true })
-    .filter((dirent) => dirent.isDirectory())
-    .map((dirent) => dirent.name);
-
-  const modules: Record<string, any> = {};
-
-  for (const dirName of directories) {
-    const moduleIndexPath = path.join(modulesPath, dirName, "index.ts");
-    if (fs.existsSync(moduleIndexPath)) {
-      try {
-        const mod = require(moduleIndexPath);
-        if (mod.moduleConfig && mod.run) {
-          modules[mod.moduleConfig.name] = mod;
-        }
-      } catch (e) {
-        log.warn(`[API] Failed to parse module in ${dirName}: ${e}`);
-      }
-    }
-  }
-
-  return modules;
-}
+app.use("/public/downloads", express.static(resolvedPaths.downloadsDir));
+app.use("/public/screenshots", express.static(resolvedPaths.screenshotsDir));
 
 // ----------------------------------------------------------------------------
 // API Endpoints
 // ----------------------------------------------------------------------------
 
-// List all registered encapsulated modules
+// List all registered encapsulated modules. The registry is cached and
+// immutable at runtime, so the summary payload is built once, not per request.
+let moduleSummary: { name: string; description: string }[] | null = null;
+
 app.get("/api/modules", (req, res) => {
-  const modules = getAvailableModules();
-  const summary = Object.keys(modules).map((name) => {
-    const mod = (modules as Record<string, any>)[name];
-    return {
-      name: mod.moduleConfig.name,
-      description: `Automated scraping module targeting ${name}`,
-    };
-  });
-  res.json({ success: true, modules: summary });
+  if (!moduleSummary) {
+    const modules = getAvailableModules();
+    moduleSummary = Object.keys(modules).map((name) => {
+      const mod = (modules as Record<string, any>)[name];
+      return {
+        name: mod.moduleConfig.name,
+        description: `Automated scraping module targeting ${name}`,
+      };
+    });
+  }
+  res.json({ success: true, modules: moduleSummary });
 });
 
 // Trigger a specific module's execution payload
@@ -102,7 +73,7 @@ app.post("/api/modules/:name/start", (req, res) => {
 // Output Directory File Manager (CRUD)
 // ----------------------------------------------------------------------------
 
-const baseOutputDir = path.resolve(process.cwd(), "output");
+const baseOutputDir = resolvedPaths.outputDir;
 
 // Helper: Ensure requested sub-paths do not escape the /output folder (Path Traversal Protection)
 function getSafePath(reqPath: string): string | null {
@@ -111,35 +82,50 @@ function getSafePath(reqPath: string): string | null {
   return target;
 }
 
-// Helper: Recursively map file tree
+// Helper: Map file tree with an explicit stack instead of recursion, so deep
+// output trees cost one loop rather than one call frame per directory
 function getFilesRecursively(dir: string, fileList: any[] = []) {
-  if (!fs.existsSync(dir)) return fileList;
-  const files = fs.readdirSync(dir);
-  for (const file of files) {
-    if (file === ".gitkeep") continue; // Hide placeholder files
-    const fullPath = path.join(dir, file);
-    const stat = fs.statSync(fullPath);
-    if (stat.isDirectory()) {
-      getFilesRecursively(fullPath, fileList);
-    } else {
-      const relativePath = path
-        .relative(baseOutputDir, fullPath)
-        .replace(/\\/g, "/");
-      fileList.push({
-        path: relativePath,
-        size: stat.size,
-        modifiedAt: stat.mtime,
-      });
+  const pending = [dir];
+  while (pending.length > 0) {
+    const current = pending.pop()!;
+    if (!fs.existsSync(current)) continue;
+    for (const file of fs.readdirSync(current)) {
+      if (file === ".gitkeep") continue; // Hide placeholder files
+      const fullPath = path.join(current, file);
+      const stat = fs.statSync(fullPath);
+      if (stat.isDirectory()) {
+        pending.push(fullPath);
+      } else {
+        const relativePath = path
+          .relative(baseOutputDir, fullPath)
+          .replace(/\\/g, "/");
+        fileList.push({
+          path: relativePath,
+          size: stat.size,
+          modifiedAt: stat.mtime,
+        });
+      }
     }
   }
   return fileList;
 }
 
-// READ: Get all files within the output directory
+// READ: Get all files within the output directory. The walk stats every
+// file, so repeated polls within a short window serve a cached listing;
+// mutations through this API invalidate it immediately and the TTL bounds
+// staleness from modules writing files directly.
+const OUTPUT_LIST_TTL_MS = 10_000;
+let outputListCache: { at: number; files: any[] } | null = null;
+
 app.get("/api/output", (req, res) => {
   try {
-    const files = getFilesRecursively(baseOutputDir);
-    res.json({ success: true, files });
+    if (!outputListCache || Date.now() - outputListCache.at > OUTPUT_LIST_TTL_MS) {
+      outputListCache = {
+        at: Date.now(),
+        files: getFilesRecursively(baseOutputDir),
+      };
+    }
+    res.json({ success: true, files: outputListCache.files });
   } catch (err: any) {
     res.status(500).json({ success: false, error: err.message });
   }
@@ -185,13 +171,13 @@ app.post(
     }
 
     try {
-      const dir = path.dirname(targetPath);
-      if (!fs.existsSync(dir)) {
-        fs.mkdirSync(dir, { recursive: true });
-      }
+      // recursive mkdir is a no-op when the directory exists, so the
+      // separate existsSync stat (and its TOCTOU window) is unnecessary.
+      fs.mkdirSync(path.dirname(targetPath), { recursive: true });
 
       // Move from temp staging to final destination securely
       fs.renameSync(req.file.path, targetPath);
+      outputListCache = null;
       res.json({
         success: true,
         message: `File successfully saved to ${targetSubPath}`,
@@ -216,6 +202,7 @@ app.delete(/^\/api\/output\/(.*)$/, (req, res) => {
 
   try {
     fs.unlinkSync(targetPath);
+    outputListCache = null;
     res.json({ success: true, message: `Successfully deleted ${filePath}` });
   } catch (err: any) {
     res.status(500).json({ success: false, error: err.message });
@@ -228,8 +215,10 @@ app.delete(/^\/api\/output\/(.*)$/, (req, res) => {
 
 export function startApiServer() {
   app.listen(config.serverPort, () => {
-    log.info(`====================================`);
-    log.info(`Winky API Server Online on Port ${config.serverPort}`);
-    log.info(`====================================`);
+    log.info(
+      "====================================\n" +
+        `Winky API Server Online on Port ${config.serverPort}\n` +
+        "====================================",
+    );
   });
 }
@@ -1,39 +1,22 @@
-import fs from "node:fs";
 import path from "node:path";
 import prompts from "prompts";
 import { log } from "./core/logger";
-import { startApiServer } from "./core/server";
+import { getAvailableModules } from "./core/module-registry";
 
-// -----------------------------------------------------
-// Bootloader & Module Discovery
-// -----------------------------------------------------
-
-function getAvailableModules() {
-  const modulesPath = path.resolve(__dirname, "modules");
-  if (!fs.existsSync(modulesPath)) return [];
-
-  const directories = fs
-    .readdirSync(modulesPath, { withFileTypes: true })
-    .filter((dirent) => dirent.isDirectory())
-    .map((dirent) => dirent.name);
-
-  const modules: Record<string, any> = {};
-
-  for (const dirName of directories) {
-    const moduleIndexPath = path.join(modulesPath, dirName, "index.ts");
-    if (fs.existsSync(moduleIndexPath)) {
-      try {
-        const mod = require(moduleIndexPath);
-        if (mod.moduleConfig && mod.run) {
-          modules[mod.moduleConfig.name] = mod;
-        }
-      } catch (e) {
-        log.warn(`[TUI] Failed to load module inside ${dirName}: ${e}`);
-      }
-    }
-  }
+// The Express/multer stack is only needed when the API server is actually
+// started, so it is required lazily instead of on every TUI boot.
+function bootApiServer() {
+  const { startApiServer } =
+    require("./core/server") as typeof import("./core/server");
+  startApiServer();
+}
 
-  return modules;
+// Closes the warm shared browser context (a no-op when none was launched).
+// Required lazily so the TUI boot does not pay the Playwright import.
+async function releaseSharedContext() {
+  const { closeSharedContext } =
+    require("./core/context") as typeof import("./core/context");
+  await closeSharedContext();
 }
 
 // -----------------------------------------------------
@@ -41,37 +24,59 @@ function getAvailableModules() {
 // -----------------------------------------------------
 
 async function showInteractiveMenu() {
-  log.info("====================================");
-  log.info(`Winky Scraper Master CLI`);
-  log.info("====================================");
-
-  const modules = getAvailableModules();
-  const moduleNames = Object.keys(modules);
-
-  const response = await prompts({
-    type: "select",
-    name: "action",
-    message: "What would you like to do?",
-    choices: [
-      { title: "Run a specific module natively", value: "run_module" },
-      {
-        title: "Start REST API Server",
-        value: "start_api",
-        description: "Boot the Express HTTP Server to remotely control modules",
-      },
-      {
-        title: "Start AI MCP Server (StdIO)",
-        value: "start_mcp",
-        description: "Exposes Playwright stealth profile to external LLMs",
-      },
-      { title: "Exit", value: "exit" },
-    ],
-  });
+  // Iterative menu loop: handlers return true to show the menu again, so a
+  // long session costs one loop pass per selection instead of stacking a
+  // call frame (and its closure) per round-trip through the menu.
+  while (true) {
+    // One prejoined write instead of three console calls per banner.
+    log.info(
+      "====================================\n" +
+        "Winky Scraper Master CLI\n" +
+        "====================================",
+    );
+
+    const response = await prompts({
+      type: "select",
+      name: "action",
+      message: "What would you like to do?",
+      choices: [
+        { title: "Run a specific module natively", value: "run_module" },
+        {
+          title: "Start REST API Server",
+          value: "start_api",
+          description:
+            "Boot the Express HTTP Server to remotely control modules",
+        },
+        {
+          title: "Start AI MCP Server (StdIO)",
+          value: "start_mcp",
+          description: "Exposes Playwright stealth profile to external LLMs",
+        },
+        { title: "Exit", value: "exit" },
+      ],
+    });
+
+    // Unknown/cancelled selections fall through to the exit handler, matching
+    // the old else branch.
+    const handler = MENU_HANDLERS[response.action] ?? MENU_HANDLERS.exit;
+    const again = await handler();
+    if (!again) break;
+  }
+}
+
+// Menu handlers keyed by choice value; a single lookup replaces the
+// if/else-if chain previously walked per selection. The boolean result tells
+// the menu loop whether to prompt again.
+const MENU_HANDLERS: Record<string, () => Promise<boolean>> = {
+  run_module: async () => {
+    // Discover (and require) modules only when the user actually wants to run
+    // one; the other menu paths skip the module import cost entirely.
+    const modules = getAvailableModules();
+    const moduleNames = Object.keys(modules);
 
-  if (response.action === "run_module") {
     if (moduleNames.length === 0) {
       log.warn("No active modules found in /src/modules.");
-      return process.exit(0);
+      process.exit(0);
     }
 
     const modResponse = await prompts({
@@ -94,14 +99,23 @@ async function showInteractiveMenu() {
       }
     }
 
-    // Recursive loop back to the main menu
+    // Loop back to the main menu
     console.log("\n");
-    await showInteractiveMenu();
-  } else if (response.action === "start_api") {
-    startApiServer();
+    return true;
+  },
+
+  start_api: async () => {
+    bootApiServer();
     // Do not loop, keep process listening infinitely
-  } else if (response.action === "start_mcp") {
+    return false;
+  },
+
+  start_mcp: async () => {
     log.info("Booting MCP Protocol on StdIO...");
+    // The MCP child opens the same persistent profile; release the warm
+    // shared context first or the parent keeps the Chromium profile lock
+    // and the child's first tool call fails to launch.
+    await releaseSharedContext();
     // We launch it via ts-node directly taking over the current process's stdio
     // shell: true is critical for Windows to resolve 'npx.cmd'
     require("child_process").spawn(
@@ -109,18 +123,22 @@ async function showInteractiveMenu() {
       ["ts-node", path.resolve(__dirname, "./core/mcp-server.ts")],
       { stdio: "inherit", shell: true },
     );
-  } else {
+    return false;
+  },
+
+  exit: async () => {
     log.info("Goodbye!");
     process.exit(0);
-  }
-}
+    return false;
+  },
+};
 
 // Boot
 if (process.env.DOCKER_ENV === "true") {
   log.info(
     `[Docker] Bypassing Interactive TUI. Booting REST Server implicitly...`,
   );
-  startApiServer();
+  bootApiServer();
 } else {
   showInteractiveMenu().catch((err) => {
     log.error(`Fatal TUI Error: ${err}`);
@@ -128,12 +146,13 @@ if (process.env.DOCKER_ENV === "true") {
   });
 }
 
-// Graceful Shutdown Handlers
+// Graceful Shutdown Handlers — release the shared browser context so the
+// persistent profile unlocks cleanly before the process dies.
 process.on("SIGINT", () => {
   log.info("\nReceived SIGINT. Shutting down gracefully...");
-  process.exit(0);
+  releaseSharedContext().finally(() => process.exit(0));
 });
 process.on("SIGTERM", () => {
   log.info("\nReceived SIGTERM. Shutting down gracefully...");
-  process.exit(0);
+  releaseSharedContext().finally(() => process.exit(0));
 });
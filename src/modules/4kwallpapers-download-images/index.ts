@@ -1,8 +1,7 @@
-import fs from "node:fs";
 import path from "node:path";
-import { createPersistentContext, saveStorageState } from "../../core/context";
+import { acquireSharedContext, saveStorageState } from "../../core/context";
 import { log } from "../../core/logger";
-import { config } from "../../config";
+import { config, resolvedPaths } from "../../config";
 
 import { run4kWallpapersDownload } from "./runner";
 
@@ -10,6 +9,10 @@ export const moduleConfig = {
   name: "4kwallpapers-download-images",
 };
 
+// Resolved once at load; the runner re-creates it per run, so no mkdir is
+// needed here.
+const OUT_DIR = path.join(resolvedPaths.downloadsDir, "4kwallpapers");
+
 let _isRunning = false;
 
 export function isRunning() {
@@ -30,19 +33,16 @@ export async function run() {
   try {
     log.info(`[${moduleConfig.name}] Starting execution using global profile...`);
 
-    context = await createPersistentContext({
+    context = await acquireSharedContext({
       profileDir: config.profileDir,
       storageStatePath: config.storageStatePath,
     });
 
     const page = context.pages()[0] ?? (await context.newPage());
 
-    const outDir = path.resolve(process.cwd(), config.downloadsDir, "4kwallpapers");
-    fs.mkdirSync(outDir, { recursive: true });
-
     await run4kWallpapersDownload(page, {
       baseUrl: "https://4kwallpapers.com/",
-      outputDir: outDir,
+      outputDir: OUT_DIR,
     });
 
     await saveStorageState(context, config.storageStatePath);
@@ -50,10 +50,8 @@ export async function run() {
   } catch (error) {
     log.error(`[${moduleConfig.name}] Critical error during execution: ${error}`);
   } finally {
-    if (context) {
-      log.info(`[${moduleConfig.name}] Closing local browser context...`);
-      await context.close().catch(() => {});
-    }
+    // The shared context stays warm for the next run (see core/context.ts),
+    // so it is deliberately not closed here.
     _isRunning = false;
   }
 }
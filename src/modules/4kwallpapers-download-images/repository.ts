@@ -67,9 +67,9 @@ export async function initTables(): Promise<void> {
   `;
 
   try {
-    await db.query(q1);
-    await db.query(q2);
-    await db.query(q3);
+    // The three tables are independent, so the DDL statements run
+    // concurrently on separate pool connections instead of back to back.
+    await Promise.all([db.query(q1), db.query(q2), db.query(q3)]);
     log.info("4KWallpapers: tables initialized.");
   } catch (e) {
     log.error(`4KWallpapers: failed to init tables: ${e}`);
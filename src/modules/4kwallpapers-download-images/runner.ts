@@ -1,9 +1,10 @@
 import path from "node:path";
 import crypto from "node:crypto";
 import fs from "node:fs";
-import { type Page } from "playwright";
+import { type APIResponse, type Page } from "playwright";
 import { log } from "../../core/logger";
 import {
+  type WallpaperStatusRow,
   createRun,
   finishRun,
   getProgress,
@@ -28,6 +29,7 @@ export interface RunOptions {
   maxPagesPerRun?: number;
   navigationTimeoutMs?: number;
   downloadOriginal?: boolean;
+  detailTabs?: number;
 }
 
 interface RunStats {
@@ -52,29 +54,155 @@ function parseWallpaperIdFromUrl(url: string): number | null {
   return Number.isFinite(n) ? n : null;
 }
 
+// Transient failures (5xx, dropped connections) get a couple of retries with
+// exponential backoff; client errors bail immediately. Concurrency is already
+// bounded by the worker-tab pool, so retries cannot pile up unbounded.
+const DOWNLOAD_ATTEMPTS = 3;
+const DOWNLOAD_BACKOFF_MS = 500;
+
 async function downloadToFile(
   page: Page,
   url: string,
   filePath: string,
 ): Promise<{ bytes: number; sha256: string } | null> {
-  const res = await page.request.get(url);
-  if (!res.ok()) {
-    log.warn(`[4kwallpapers] Download failed: ${res.status()} ${url}`);
-    return null;
+  let res: APIResponse | null = null;
+  for (let attempt = 1; attempt <= DOWNLOAD_ATTEMPTS; attempt++) {
+    try {
+      res = await page.request.get(url);
+      if (res.ok()) break;
+      if (res.status() < 500 || attempt === DOWNLOAD_ATTEMPTS) {
+        log.warn(`[4kwallpapers] Download failed: ${res.status()} ${url}`);
+        return null;
+      }
+    } catch (e) {
+      if (attempt === DOWNLOAD_ATTEMPTS) {
+        log.warn(`[4kwallpapers] Download failed: ${e} ${url}`);
+        return null;
+      }
+    }
+    await new Promise((r) =>
+      setTimeout(r, DOWNLOAD_BACKOFF_MS * 2 ** (attempt - 1)),
+    );
   }
+  if (!res || !res.ok()) return null;
 
   const buf = await res.body();
-  fs.mkdirSync(path.dirname(filePath), { recursive: true });
-  fs.writeFileSync(filePath, buf);
+  // Hash while the async write is in flight; a sync write here would stall
+  // the event loop (and every other worker tab) for the whole file.
+  const writePromise = fs.promises.writeFile(filePath, buf);
   const sha = crypto.createHash("sha256").update(buf).digest("hex");
+  await writePromise;
   return { bytes: buf.length, sha256: sha };
 }
 
+// Per-item work lives at module scope with explicit parameters rather than as
+// a closure rebuilt inside every run; itemCtx carries the loop-invariant
+// settings the workers share.
+interface ItemContext {
+  // Output directory with a trailing separator, computed once so the per-item
+  // path is a plain concatenation rather than a path.join call.
+  outputPathPrefix: string;
+  downloadOriginal: boolean;
+  stats: RunStats;
+}
+
+async function processItem(
+  tab: Page,
+  item: ListingItem,
+  hashId: string,
+  status: WallpaperStatusRow | null,
+  ctx: ItemContext,
+): Promise<void> {
+  const pageUrl = item.detailUrl;
+
+  // Parsed once per item; it is reused for both upsert paths and the
+  // output filename below.
+  const wallpaperId = parseWallpaperIdFromUrl(pageUrl);
+
+  log.info(`[4kwallpapers] New wallpaper: ${pageUrl}`);
+  // "commit" returns as soon as the navigation is committed;
+  // extractWallpaperDetail already waits for #content before reading,
+  // so the extra domcontentloaded wait per detail page is redundant.
+  await tab.goto(pageUrl, { waitUntil: "commit" });
+
+  const detail: WallpaperDetail | null = await extractWallpaperDetail(tab);
+  if (!detail?.downloadUrl) {
+    log.warn(`[4kwallpapers] Missing download url: ${pageUrl}`);
+    await upsertWallpaper({
+      hash_id: hashId,
+      wallpaper_id: wallpaperId,
+      page_url: pageUrl,
+      title: detail?.title ?? null,
+      category: detail?.category ?? null,
+      tags: detail?.tags ?? item.keywords ?? null,
+      thumb_url: item.thumbUrl ?? null,
+      download_url: null,
+    });
+    return;
+  }
+
+  const dlUrl = detail.downloadUrl;
+  const fileBase = safeBasename(
+    `${detail.title ?? "wallpaper"}-${wallpaperId ?? hashId.slice(0, 12)}`,
+  );
+  const ext = path.extname(new URL(dlUrl).pathname) || ".jpg";
+  const outPath = `${ctx.outputPathPrefix}${fileBase}${ext}`;
+
+  // A known row whose download_url still matches carries the same metadata,
+  // so the refresh write is skipped; only new or changed rows pay the upsert.
+  const upsertPromise =
+    status?.download_url === dlUrl
+      ? Promise.resolve()
+      : upsertWallpaper({
+          hash_id: hashId,
+          wallpaper_id: wallpaperId,
+          page_url: pageUrl,
+          title: detail.title ?? null,
+          category: detail.category ?? null,
+          tags: detail.tags ?? item.keywords ?? null,
+          thumb_url: item.thumbUrl ?? null,
+          download_url: dlUrl,
+        });
+
+  if (!ctx.downloadOriginal) {
+    await upsertPromise;
+    return;
+  }
+
+  if (status?.download_url && status.download_url !== dlUrl) {
+    log.info(`[4kwallpapers] Download url updated for: ${pageUrl}`);
+  }
+
+  // The metadata upsert and the image download touch different systems,
+  // so they run concurrently; both must settle before markDownloaded.
+  const [, downloaded] = await Promise.all([
+    upsertPromise,
+    downloadToFile(tab, dlUrl, outPath),
+  ]);
+  if (!downloaded) {
+    ctx.stats.downloadFailed++;
+    return;
+  }
+
+  ctx.stats.downloaded++;
+  await markDownloaded(hashId, {
+    file_path: outPath,
+    file_sha256: downloaded.sha256,
+    file_bytes: downloaded.bytes,
+  });
+  log.info(`[4kwallpapers] Downloaded -> ${outPath}`);
+}
+
 export async function run4kWallpapersDownload(page: Page, options: RunOptions) {
   const jobKey = options.jobKey ?? "recent";
   const maxPagesPerRun = options.maxPagesPerRun ?? 5;
   const navigationTimeoutMs = options.navigationTimeoutMs ?? 60_000;
   const downloadOriginal = options.downloadOriginal ?? true;
+  const detailTabs = Math.max(1, options.detailTabs ?? 3);
+
+  // All downloads land in outputDir, so it is created once per run instead of
+  // re-checked on every file write.
+  fs.mkdirSync(options.outputDir, { recursive: true });
 
   await initTables();
 
@@ -98,15 +226,39 @@ export async function run4kWallpapersDownload(page: Page, options: RunOptions) {
   let currentPageNum = startPage;
   let lastSuccessfulPageNum = startPage - 1;
 
+  // Progress writes from the previous page overlap with the next list-page
+  // navigation; the promise is settled before that page's items are handled.
+  let pendingProgress: Promise<void> | null = null;
+
+  // Dedicated tabs for detail pages: the main page keeps the listing while up
+  // to detailTabs workers fan out over the items concurrently.
+  const workerTabs: Page[] = await Promise.all(
+    Array.from({ length: detailTabs }, () => page.context().newPage()),
+  );
+
+  // The navigation timeout is configured once per page instead of being
+  // marshalled as an option on every goto below.
+  for (const p of [page, ...workerTabs]) {
+    p.setDefaultNavigationTimeout(navigationTimeoutMs);
+  }
+
+  const itemCtx: ItemContext = {
+    outputPathPrefix: options.outputDir + path.sep,
+    downloadOriginal,
+    stats,
+  };
+
   try {
     for (let i = 0; i < maxPagesPerRun; i++) {
       const listUrl = resolveListUrl(options.baseUrl, currentPageNum);
 
       log.info(`[4kwallpapers] Visiting list page ${currentPageNum}: ${listUrl}`);
-      await page.goto(listUrl, {
-        waitUntil: "domcontentloaded",
-        timeout: navigationTimeoutMs,
-      });
+      await page.goto(listUrl, { waitUntil: "domcontentloaded" });
+
+      if (pendingProgress) {
+        await pendingProgress;
+        pendingProgress = null;
+      }
 
       const items: ListingItem[] = await extractListingItems(page);
       if (items.length === 0) {
@@ -117,82 +269,49 @@ export async function run4kWallpapersDownload(page: Page, options: RunOptions) {
       stats.pagesVisited++;
       lastSuccessfulPageNum = currentPageNum;
 
-      for (const item of items) {
-        const pageUrl = item.detailUrl;
-        const hashId = sha256Hex(pageUrl);
-        const status = await getWallpaperStatus(hashId);
-        if (status?.downloaded_at) {
-          stats.skippedExisting++;
-          continue;
-        }
-
-        if (!status) stats.newItems++;
-
-        log.info(`[4kwallpapers] New wallpaper: ${pageUrl}`);
-        await page.goto(pageUrl, {
-          waitUntil: "domcontentloaded",
-          timeout: navigationTimeoutMs,
-        });
+      // Fetch the dedup status of every listed item concurrently instead of
+      // paying one sequential DB round-trip per item.
+      const hashIds = items.map((it) => sha256Hex(it.detailUrl));
+      const statuses = await Promise.all(
+        hashIds.map((h) => getWallpaperStatus(h)),
+      );
 
-        const detail: WallpaperDetail | null = await extractWallpaperDetail(page);
-        if (!detail?.downloadUrl) {
-          log.warn(`[4kwallpapers] Missing download url: ${pageUrl}`);
-          await upsertWallpaper({
-            hash_id: hashId,
-            wallpaper_id: parseWallpaperIdFromUrl(pageUrl),
-            page_url: pageUrl,
-            title: detail?.title ?? null,
-            category: detail?.category ?? null,
-            tags: detail?.tags ?? item.keywords ?? null,
-            thumb_url: item.thumbUrl ?? null,
-            download_url: null,
-          });
-          continue;
-        }
-
-        const dlUrl = detail.downloadUrl;
-        const fileBase = safeBasename(
-          `${detail.title ?? "wallpaper"}-${parseWallpaperIdFromUrl(pageUrl) ?? hashId.slice(0, 12)}`,
-        );
-        const ext = path.extname(new URL(dlUrl).pathname) || ".jpg";
-        const outPath = path.join(options.outputDir, `${fileBase}${ext}`);
-
-        await upsertWallpaper({
-          hash_id: hashId,
-          wallpaper_id: parseWallpaperIdFromUrl(pageUrl),
-          page_url: pageUrl,
-          title: detail.title ?? null,
-          category: detail.category ?? null,
-          tags: detail.tags ?? item.keywords ?? null,
-          thumb_url: item.thumbUrl ?? null,
-          download_url: dlUrl,
-        });
-
-        if (!downloadOriginal) continue;
+      // Fan the items out across the tab pool; each worker pulls the next
+      // pending item, so one slow detail page or download never stalls the
+      // rest of the batch.
+      let nextIdx = 0;
+      const results = await Promise.allSettled(
+        workerTabs.map(async (tab) => {
+          while (true) {
+            const idx = nextIdx++;
+            if (idx >= items.length) break;
 
-        if (status?.download_url && status.download_url !== dlUrl) {
-          log.info(`[4kwallpapers] Download url updated for: ${pageUrl}`);
-        }
+            const status = statuses[idx];
+            if (status?.downloaded_at) {
+              stats.skippedExisting++;
+              continue;
+            }
+            if (!status) stats.newItems++;
 
-        const downloaded = await downloadToFile(page, dlUrl, outPath);
-        if (!downloaded) {
-          stats.downloadFailed++;
-          continue;
-        }
-
-        stats.downloaded++;
-        await markDownloaded(hashId, {
-          file_path: outPath,
-          file_sha256: downloaded.sha256,
-          file_bytes: downloaded.bytes,
-        });
-        log.info(`[4kwallpapers] Downloaded -> ${outPath}`);
+            await processItem(tab, items[idx], hashIds[idx], status, itemCtx);
+          }
+        }),
+      );
+      const failure = results.find((r) => r.status === "rejected");
+      if (failure) {
+        throw (failure as PromiseRejectedResult).reason;
       }
 
       currentPageNum++;
-      await setProgress(jobKey, { next_page: currentPageNum });
+      pendingProgress = setProgress(jobKey, { next_page: currentPageNum }).catch(
+        (e) => {
+          log.warn(`[4kwallpapers] Failed to persist progress: ${e}`);
+        },
+      );
     }
 
+    if (pendingProgress) await pendingProgress;
+
     await finishRun(runId, {
       status: "success",
       end_page: lastSuccessfulPageNum,
@@ -206,5 +325,7 @@ export async function run4kWallpapersDownload(page: Page, options: RunOptions) {
       error_message: String(err),
     });
     throw err;
+  } finally {
+    await Promise.all(workerTabs.map((t) => t.close().catch(() => {})));
   }
 }
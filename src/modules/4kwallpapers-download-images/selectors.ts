@@ -33,27 +33,34 @@ export async function extractListingItems(page: Page): Promise<ListingItem[]> {
       document.querySelectorAll<HTMLParagraphElement>("#pics-list p.wallpapers__item"),
     );
 
-    return nodes
-      .map((p) => {
-        const a = p.querySelector<HTMLAnchorElement>("a.wallpapers__canvas_image");
-        const img = p.querySelector<HTMLImageElement>("img[itemprop='thumbnail']");
-        const meta = p.querySelector<HTMLMetaElement>("meta[itemprop='keywords']");
-
-        const href = a?.href ?? null;
-        if (!href) return null;
-
-        const thumbUrl = img?.src ?? null;
-        const keywordsRaw = meta?.content ?? null;
-        const keywords = keywordsRaw
-          ? keywordsRaw
-              .split(",")
-              .map((x) => x.trim())
-              .filter(Boolean)
-          : null;
-
-        return { detailUrl: href, thumbUrl, keywords };
-      })
-      .filter((x): x is { detailUrl: string; thumbUrl: string | null; keywords: string[] | null } => Boolean(x));
+    // Single accumulation pass: no intermediate null entries to filter out.
+    const out: {
+      detailUrl: string;
+      thumbUrl: string | null;
+      keywords: string[] | null;
+    }[] = [];
+
+    for (const p of nodes) {
+      const a = p.querySelector<HTMLAnchorElement>("a.wallpapers__canvas_image");
+      const href = a?.href ?? null;
+      if (!href) continue;
+
+      const img = p.querySelector<HTMLImageElement>("img[itemprop='thumbnail']");
+      const meta = p.querySelector<HTMLMetaElement>("meta[itemprop='keywords']");
+
+      const thumbUrl = img?.src ?? null;
+      const keywordsRaw = meta?.content ?? null;
+      const keywords = keywordsRaw
+        ? keywordsRaw
+            .split(",")
+            .map((x) => x.trim())
+            .filter(Boolean)
+        : null;
+
+      out.push({ detailUrl: href, thumbUrl, keywords });
+    }
+
+    return out;
   });
 
   return items;
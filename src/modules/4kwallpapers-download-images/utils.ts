@@ -4,12 +4,17 @@ export function sha256Hex(input: string): string {
   return crypto.createHash("sha256").update(input).digest("hex");
 }
 
+// Compiled once at load; safeBasename runs for every downloaded file.
+const WHITESPACE_RE = /\s+/g;
+const UNSAFE_CHARS_RE = /[\\/:*?"<>|]/g;
+const TRAILING_DOTS_RE = /\.+$/g;
+
 export function safeBasename(name: string): string {
   const cleaned = name
-    .replace(/\s+/g, " ")
+    .replace(WHITESPACE_RE, " ")
     .trim()
-    .replace(/[\\/:*?"<>|]/g, "-")
-    .replace(/\.+$/g, "")
+    .replace(UNSAFE_CHARS_RE, "-")
+    .replace(TRAILING_DOTS_RE, "")
     .slice(0, 140);
 
   return cleaned.length > 0 ? cleaned : "wallpaper";
@@ -1,4 +1,4 @@
-import { type Locator, type Page } from "playwright";
+import { type Page } from "playwright";
 
 export type GmailListItem = {
   from: string | null;
@@ -13,38 +13,6 @@ function cleanText(s: string | null | undefined) {
   return v.length ? v : null;
 }
 
-async function firstAttr(
-  locators: Locator[],
-  attr: string,
-) {
-  for (const l of locators) {
-    try {
-      if ((await l.count()) > 0) {
-        const v = await l.first().getAttribute(attr);
-        if (v) return v;
-      }
-    } catch {
-      // ignore and continue
-    }
-  }
-  return null;
-}
-
-async function firstText(locators: Locator[]) {
-  for (const l of locators) {
-    try {
-      if ((await l.count()) > 0) {
-        const v = await l.first().innerText();
-        const cleaned = cleanText(v);
-        if (cleaned) return cleaned;
-      }
-    } catch {
-      // ignore and continue
-    }
-  }
-  return null;
-}
-
 export async function extractLatestGmails(page: Page, limit = 5) {
   await page.goto("https://mail.google.com/mail/u/0/#inbox", {
     waitUntil: "domcontentloaded",
@@ -64,35 +32,42 @@ export async function extractLatestGmails(page: Page, limit = 5) {
     throw new Error(`Failed to detect Gmail inbox. ${hint} (url=${url})`);
   }
 
-  const count = await rows.count();
-  const take = Math.min(limit, count);
-  const items: GmailListItem[] = [];
-
-  for (let i = 0; i < take; i++) {
-    const row = rows.nth(i);
-
-    const sender = row.locator(
-      ".yX.xY span[email], .yX span[email], span[email]",
-    );
-    const subject = row.locator("span.bog, .bog");
-    const snippet = row.locator("span.y2, .y2");
-    const time = row.locator(
-      "td.xW span[title], span[title][aria-label], td.xW span",
-    );
+  // Read every field of every row in one in-page pass. The previous per-row
+  // locator probes cost ~10 sequential protocol round-trips per email.
+  const raw = await page.evaluate((max) => {
+    const rowEls = Array.from(
+      document.querySelectorAll<HTMLTableRowElement>("tr.zA"),
+    ).slice(0, max);
 
-    const fromEmail = await firstAttr([sender], "email");
-    const fromNameAttr = await firstAttr([sender], "name");
-    const fromText = await firstText([sender]);
-    const timeTitle = await firstAttr([time], "title");
+    return rowEls.map((row) => {
+      const sender = row.querySelector<HTMLElement>(
+        ".yX.xY span[email], .yX span[email], span[email]",
+      );
+      const subject = row.querySelector<HTMLElement>("span.bog, .bog");
+      const snippet = row.querySelector<HTMLElement>("span.y2, .y2");
+      const time = row.querySelector<HTMLElement>(
+        "td.xW span[title], span[title][aria-label], td.xW span",
+      );
 
-    items.push({
-      from: cleanText(fromNameAttr) ?? fromText,
-      fromEmail: cleanText(fromEmail),
-      subject: await firstText([subject]),
-      snippet: await firstText([snippet]),
-      timeTitle: cleanText(timeTitle),
+      return {
+        // || (not ??) so an empty name="" attribute still falls back to the
+        // visible sender text, matching the old firstAttr helper.
+        from: sender?.getAttribute("name") || sender?.innerText || null,
+        fromEmail: sender?.getAttribute("email") ?? null,
+        subject: subject?.innerText ?? null,
+        snippet: snippet?.innerText ?? null,
+        timeTitle: time?.getAttribute("title") ?? null,
+      };
     });
-  }
+  }, limit);
+
+  const items: GmailListItem[] = raw.map((r) => ({
+    from: cleanText(r.from),
+    fromEmail: cleanText(r.fromEmail),
+    subject: cleanText(r.subject),
+    snippet: cleanText(r.snippet),
+    timeTitle: cleanText(r.timeTitle),
+  }));
 
   return items;
 }
@@ -1,8 +1,8 @@
 import fs from "node:fs";
 import path from "node:path";
-import { createPersistentContext, saveStorageState } from "../../core/context";
+import { acquireSharedContext, saveStorageState } from "../../core/context";
 import { log } from "../../core/logger";
-import { config } from "../../config";
+import { config, resolvedPaths } from "../../config";
 
 import { extractLatestGmails } from "./gmail-latest-5";
 
@@ -10,6 +10,11 @@ export const moduleConfig = {
   name: "gmail-latest-5",
 };
 
+// Output locations never change between runs, so they are resolved once at
+// load instead of per execution.
+const OUT_DIR = path.join(resolvedPaths.outputDir, "gmail");
+const OUT_PATH = path.join(OUT_DIR, "latest-5.json");
+
 let _isRunning = false;
 
 export function isRunning() {
@@ -30,7 +35,7 @@ export async function run() {
   try {
     log.info(`[${moduleConfig.name}] Starting execution using global profile...`);
 
-    context = await createPersistentContext({
+    context = await acquireSharedContext({
       profileDir: config.profileDir,
       storageStatePath: config.storageStatePath,
     });
@@ -39,10 +44,14 @@ export async function run() {
 
     const items = await extractLatestGmails(page, 5);
 
-    const outDir = path.resolve(process.cwd(), "output", "gmail");
-    fs.mkdirSync(outDir, { recursive: true });
-    const outPath = path.join(outDir, "latest-5.json");
-    fs.writeFileSync(outPath, JSON.stringify(items, null, 2), "utf8");
+    // Async fs keeps the event loop (and any concurrently running module)
+    // responsive instead of blocking it on disk writes.
+    await fs.promises.mkdir(OUT_DIR, { recursive: true });
+    await fs.promises.writeFile(
+      OUT_PATH,
+      JSON.stringify(items, null, 2),
+      "utf8",
+    );
 
     log.info(`[${moduleConfig.name}] Latest 5 emails:`);
     for (const item of items) {
@@ -51,17 +60,15 @@ export async function run() {
         `[${moduleConfig.name}] - ${item.timeTitle ?? ""} | ${from ?? ""} | ${item.subject ?? ""}`,
       );
     }
-    log.info(`[${moduleConfig.name}] Wrote ${items.length} items -> ${outPath}`);
+    log.info(`[${moduleConfig.name}] Wrote ${items.length} items -> ${OUT_PATH}`);
 
     await saveStorageState(context, config.storageStatePath);
     log.info(`[${moduleConfig.name}] Execution finished successfully.`);
   } catch (error) {
     log.error(`[${moduleConfig.name}] Critical error during execution: ${error}`);
   } finally {
-    if (context) {
-      log.info(`[${moduleConfig.name}] Closing local browser context...`);
-      await context.close().catch(() => {});
-    }
+    // The shared context stays warm for the next run (see core/context.ts),
+    // so it is deliberately not closed here.
     _isRunning = false;
   }
 }
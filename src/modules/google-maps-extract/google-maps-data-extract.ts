@@ -8,292 +8,435 @@ import {
 } from "./repository";
 import { type SalonData } from "./types";
 
-export async function googleMapsDataExtract(page: Page) {
-  log.info(`Initializing Database...`);
-  await initTable();
+// About-tab labels checked against every line of the pane text; hoisted so the
+// per-line loop does set lookups instead of chained string compares.
+const ABOUT_SECTIONS = new Set([
+  "Accessibility",
+  "Amenities",
+  "Planning",
+  "Payments",
+]);
+const ABOUT_HEADINGS = new Set([
+  ...ABOUT_SECTIONS,
+  "About",
+  "About this data",
+]);
+
+// Everything this module reads is text; photos, avatars, fonts and videos
+// are the bulk of what each pane render transfers and are safe to drop.
+const BLOCKED_RESOURCE_TYPES = new Set(["image", "font", "media"]);
+
+// One precompiled scan over each line replaces four chained includes() checks
+// when sniffing website-looking lines in the overview text.
+const WEBSITE_TLD_RE = /\.(?:com|lk|net|org)/;
+
+// In-page scroll snippet used by the feed pagination; defined once at module
+// scope so the hot loop does not re-create the closure on every scroll.
+const scrollToBottom = (el: HTMLElement) => {
+  el.scrollTo(0, el.scrollHeight);
+};
 
-  log.info(`Going to Google Maps...`);
-  await page.goto(
-    "https://www.google.com/maps/search/salons+in+colombo+district/",
-    { waitUntil: "domcontentloaded" },
+export async function googleMapsDataExtract(page: Page) {
+  // Route interception is installed before the first navigation and removed
+  // in the finally below, since the page is shared with other modules.
+  await page.route("**/*", (route) =>
+    BLOCKED_RESOURCE_TYPES.has(route.request().resourceType())
+      ? route.abort()
+      : route.continue(),
   );
 
-  const title = await page.title();
-  log.info(`Title: ${title}`);
-
-  log.info("Waiting for the feed container to load...");
-  const feed = page.getByRole("feed");
-  await feed.waitFor({ state: "visible", timeout: 15000 });
-
-  let scrapedCount = 0;
-  let previousItemCount = 0;
-  let stagnantScrolls = 0;
-  const targetItems = 1000;
-
-  log.info("Starting to scrape salons...");
-
-  while (scrapedCount < targetItems) {
-    const articles = page.getByRole("article");
-    const count = await articles.count();
-
-    for (let i = 0; i < count; i++) {
-      const articlesList = page.getByRole("article");
-      if (i >= (await articlesList.count())) break;
-      const article = articlesList.nth(i);
-
-      try {
-        const linkEl = article.getByRole("link").first();
-        const url = await linkEl.getAttribute("href");
-        if (!url) continue;
-
-        const rawName =
-          (await article.getAttribute("aria-label")) ?? "Unknown Name";
-
-        // 1. DEDUPLICATION TRACKER CHECK
-        const hashId = generateSalonHash(rawName, url);
-        if (await salonExists(hashId)) {
-          // Skip silently to quickly resume to the breaking point.
-          continue;
-        }
-
-        log.info(`Processing new salon: ${rawName}`);
-        await article.scrollIntoViewIfNeeded();
-        await article.click();
-        await page.waitForTimeout(3000); // Wait for pane animation to settle
-
-        const pane = page.getByRole("main").last();
-        if (!(await pane.isVisible())) continue;
-
-        // ---- 2. OVERVIEW TAB DATA ----
-        const overviewText = await pane.innerText();
-        const overviewLines = overviewText
-          .split("\n")
-          .map((l) => l.trim())
-          .filter(Boolean);
-
-        // Best effort basic parse based on common Maps structure:
-        const name = rawName;
-        // Looking for rating (e.g. "4.8(123)")
-        const ratingLine = overviewLines.find(
-          (l) =>
-            typeof l === "string" &&
-            l.includes("(") &&
-            l.includes(")") &&
-            !isNaN(parseFloat(l[0])),
-        );
+  try {
+    // The DDL round-trip and the initial navigation touch different systems,
+    // so the two startup waits overlap instead of running back to back.
+    log.info(`Initializing Database and going to Google Maps...`);
+    await Promise.all([
+      initTable(),
+      page.goto(
+        "https://www.google.com/maps/search/salons+in+colombo+district/",
+        { waitUntil: "domcontentloaded" },
+      ),
+    ]);
+
+    log.info("Waiting for the feed container to load...");
+    // Maps sets explicit role attributes on these containers, so plain CSS
+    // attribute selectors resolve them without the role engine's
+    // accessible-name computation over every element.
+    const feed = page.locator("[role='feed']");
+    await feed.waitFor({ state: "visible", timeout: 15000 });
+
+    let scrapedCount = 0;
+    let previousItemCount = 0;
+    let stagnantScrolls = 0;
+    const targetItems = 1000;
+
+    log.info("Starting to scrape salons...");
+
+    // The feed is re-scanned from the top after every scroll, so each card's
+    // dedup status would otherwise be re-queried from Postgres on every pass.
+    // Hashes known to exist (from the DB or saved this run) are cached here.
+    const knownHashes = new Set<string>();
+
+    // Locators are reusable selector descriptions, not live handles, so build
+    // the ones needed on every iteration once instead of per card.
+    const articles = page.locator("[role='article']");
+    const closeBtn = page.locator('button[aria-label="Close"]').last();
+    const pane = page.locator("[role='main']").last();
+    // In English UI, tab text is exactly "Reviews" / "About"
+    const reviewsTab = page.getByRole("tab", { name: "Reviews" });
+    const aboutTab = page.getByRole("tab", { name: "About" });
+
+    while (scrapedCount < targetItems) {
+      // Read the link href and aria-label of every result card in one in-page
+      // pass instead of two getAttribute round-trips per card; the batch's
+      // length is also the card count, saving a separate count() round-trip
+      // per iteration (the feed only grows, so no per-card recheck is needed —
+      // a stale click simply falls into the catch below).
+      const cardInfos = await articles.evaluateAll((els) =>
+        els.map((el) => ({
+          url: el.querySelector("a")?.getAttribute("href") ?? null,
+          name: el.getAttribute("aria-label"),
+        })),
+      );
+      const count = cardInfos.length;
 
-        let phone = null;
-        let website = null;
+      for (let i = 0; i < count; i++) {
+        const article = articles.nth(i);
 
-        for (const line of overviewLines) {
-          // Basic phone match logic (contains digits and spaces typically)
-          if (
-            /^[\d\s+\-\()]{8,15}$/.test(line.replace(/[^0-9+]/g, "")) &&
-            line.length > 8
-          ) {
-            phone = line;
-          }
-          // Basic website match logic
-          if (
-            line.includes(".com") ||
-            line.includes(".lk") ||
-            line.includes(".net") ||
-            line.includes(".org")
-          ) {
-            if (line.indexOf(" ") === -1 && line.length > 5) website = line;
+        try {
+          const url = cardInfos[i]?.url;
+          if (!url) continue;
+
+          const rawName = cardInfos[i]?.name ?? "Unknown Name";
+
+          // 1. DEDUPLICATION TRACKER CHECK
+          const hashId = generateSalonHash(rawName, url);
+          if (knownHashes.has(hashId)) continue;
+          if (await salonExists(hashId)) {
+            // Skip silently to quickly resume to the breaking point.
+            knownHashes.add(hashId);
+            continue;
           }
-        }
-
-        // Address is usually near the top, often containing "Colombo"
-        const addressMatch = overviewLines.find(
-          (l) =>
-            l.toLowerCase().includes("colombo") &&
-            l.length > 10 &&
-            !l.includes("Opens") &&
-            !l.includes("("),
-        );
 
-        // ---- 3. REVIEWS TAB DATA ----
-        let searchTags: string[] = [];
-        let reviewsText: string[] = [];
-
-        try {
-          // In English UI, Tab text is exactly "Reviews"
-          const reviewsTab = page.getByRole("tab", { name: "Reviews" });
-          if (await reviewsTab.isVisible()) {
-            await reviewsTab.click();
-            await page.waitForTimeout(1500); // let reviews load
-
-            // "Sort" buttons or "All" badges often contain the search tags.
-            const rawReviewText = await pane.innerText();
-            const revLines = rawReviewText
-              .split("\n")
-              .map((l) => l.trim())
-              .filter(Boolean);
-
-            // Heuristic to grab search tags: they usually appear between "Sort" / "All" and the first reviewer name.
-            let inTags = false;
-            for (let j = 0; j < revLines.length; j++) {
-              const l = revLines[j];
-              if (l === "All") {
-                inTags = true;
-                continue;
-              }
-              if (inTags && l.includes("reviews")) break; // end of tags
-              if (inTags && l.length < 30 && isNaN(Number(l))) {
-                // Only push if it doesn't look like a number
-                if (!searchTags.includes(l)) searchTags.push(l);
-              }
+          log.info(`Processing new salon: ${rawName}`);
+          // click() scrolls the target into view as part of its actionability
+          // checks, so the explicit scrollIntoViewIfNeeded round-trip is
+          // redundant.
+          await article.click();
+          // Wait until the detail pane is actually showing this salon instead
+          // of sleeping a fixed 3s; quiet pages continue as soon as the pane
+          // renders, and the timeout bounds the old pacing when Maps stalls.
+          await page
+            .waitForFunction(
+              (name) => {
+                const mains =
+                  document.querySelectorAll<HTMLElement>("[role='main']");
+                const el = mains[mains.length - 1];
+                // getClientRects() mirrors Playwright's own visibility check;
+                // offsetParent is null for fixed-positioned elements even
+                // when they are fully visible.
+                if (!el || el.getClientRects().length === 0) return false;
+                return name === "Unknown Name" || el.innerText.includes(name);
+              },
+              rawName,
+              { timeout: 5000 },
+            )
+            .catch(() => {});
+
+          // ---- 2. OVERVIEW TAB DATA ----
+          // Probe pane visibility and read its text in one round-trip instead
+          // of a separate isVisible + innerText pair.
+          const overviewText = await page.evaluate(() => {
+            const mains = document.querySelectorAll<HTMLElement>("[role='main']");
+            const el = mains[mains.length - 1];
+            if (!el || el.getClientRects().length === 0) return null;
+            return el.innerText;
+          });
+          if (overviewText === null) continue;
+          const overviewLines = overviewText
+            .split("\n")
+            .map((l) => l.trim())
+            .filter(Boolean);
+
+          // Best effort basic parse based on common Maps structure. All four
+          // fields are classified in a single pass over the lines instead of
+          // separate find/loop scans per field.
+          const name = rawName;
+          let ratingLine: string | null = null; // e.g. "4.8(123)"
+          let phone: string | null = null;
+          let website: string | null = null;
+          let addressMatch: string | null = null;
+
+          for (const line of overviewLines) {
+            if (
+              !ratingLine &&
+              line.includes("(") &&
+              line.includes(")") &&
+              !isNaN(parseFloat(line[0]))
+            ) {
+              ratingLine = line;
             }
-
-            // Scroll down a bit in the reviews section to load some
-            const scrollableReviewArea = pane.locator(".m6QErb").first();
-            if (await scrollableReviewArea.isVisible()) {
-              await scrollableReviewArea.evaluate((el) =>
-                el.scrollTo(0, el.scrollHeight),
-              );
-              await page.waitForTimeout(1000);
+            // Basic phone match logic (contains digits and spaces typically)
+            if (
+              /^[\d\s+\-\()]{8,15}$/.test(line.replace(/[^0-9+]/g, "")) &&
+              line.length > 8
+            ) {
+              phone = line;
             }
-
-            // Get Review elements
-            const reviewElements = pane.locator("[data-review-id]");
-            const reviewCount = await reviewElements.count();
-            const limit = Math.min(reviewCount, 20); // Get up to 20
-
-            for (let r = 0; r < limit; r++) {
-              const rText = await reviewElements.nth(r).innerText();
-              // Clean up the inner text into a flattened string
-              reviewsText.push(rText.replace(/\n+/g, " | "));
+            // Basic website match logic
+            if (WEBSITE_TLD_RE.test(line)) {
+              if (line.indexOf(" ") === -1 && line.length > 5) website = line;
+            }
+            // Address is usually near the top, often containing "Colombo"
+            if (
+              !addressMatch &&
+              line.toLowerCase().includes("colombo") &&
+              line.length > 10 &&
+              !line.includes("Opens") &&
+              !line.includes("(")
+            ) {
+              addressMatch = line;
             }
           }
-        } catch (e) {
-          log.warn("Failed extracting reviews");
-        }
 
-        // ---- 4. ABOUT TAB DATA ----
-        let accessibility: string[] = [];
-        let amenities: string[] = [];
-        let planning: string[] = [];
-        let payments: string[] = [];
-
-        try {
-          const aboutTab = page.getByRole("tab", { name: "About" });
-          if (await aboutTab.isVisible()) {
-            await aboutTab.click();
-            await page.waitForTimeout(1500);
-
-            const aboutText = await pane.innerText();
-            const aLines = aboutText
-              .split("\n")
-              .map((l) => l.trim())
-              .filter(Boolean);
-
-            let currentSection = "";
-            for (const l of aLines) {
-              if (l === "Accessibility") {
-                currentSection = "Accessibility";
-                continue;
-              }
-              if (l === "Amenities") {
-                currentSection = "Amenities";
-                continue;
+          // Probe both tab visibilities concurrently; racing the two
+          // round-trips costs max() instead of sum() of their latencies.
+          const [reviewsVisible, aboutVisible] = await Promise.all([
+            reviewsTab.isVisible(),
+            aboutTab.isVisible(),
+          ]);
+
+          // ---- 3. REVIEWS TAB DATA ----
+          let searchTags: string[] = [];
+          let reviewsText: string[] = [];
+
+          try {
+            if (reviewsVisible) {
+              await reviewsTab.click();
+              // Resume as soon as the first review card attaches rather than
+              // sleeping a fixed 1.5s; the catch keeps going when a place
+              // simply has no reviews.
+              await pane
+                .locator("[data-review-id]")
+                .first()
+                .waitFor({ state: "attached", timeout: 2500 })
+                .catch(() => {});
+
+              // "Sort" buttons or "All" badges often contain the search tags.
+              const rawReviewText = await pane.innerText();
+              const revLines = rawReviewText
+                .split("\n")
+                .map((l) => l.trim())
+                .filter(Boolean);
+
+              // Heuristic to grab search tags: they usually appear between "Sort" / "All" and the first reviewer name.
+              // A Set deduplicates in O(1) instead of includes() rescanning the list.
+              const tagSet = new Set<string>();
+              let inTags = false;
+              for (let j = 0; j < revLines.length; j++) {
+                const l = revLines[j];
+                if (l === "All") {
+                  inTags = true;
+                  continue;
+                }
+                if (inTags && l.includes("reviews")) break; // end of tags
+                if (inTags && l.length < 30 && isNaN(Number(l))) {
+                  // Only keep it if it doesn't look like a number
+                  tagSet.add(l);
+                }
               }
-              if (l === "Planning") {
-                currentSection = "Planning";
-                continue;
-              }
-              if (l === "Payments") {
-                currentSection = "Payments";
-                continue;
+              searchTags = Array.from(tagSet);
+
+              // Scroll down a bit in the reviews section to load some; the
+              // area is resolved, visibility-checked and scrolled in a single
+              // in-page call that also reports how many reviews were already
+              // attached (-1 when the area is missing/hidden).
+              const prevReviewCount = await page.evaluate(() => {
+                const mains =
+                  document.querySelectorAll<HTMLElement>("[role='main']");
+                const area =
+                  mains[mains.length - 1]?.querySelector<HTMLElement>(".m6QErb");
+                if (!area || area.getClientRects().length === 0) return -1;
+                const loaded =
+                  area.querySelectorAll("[data-review-id]").length;
+                area.scrollTo(0, area.scrollHeight);
+                return loaded;
+              });
+              if (prevReviewCount >= 0) {
+                // Adaptive pacing: resume once extra reviews attach instead of
+                // a flat 1s sleep; the cap keeps the old worst case.
+                await page
+                  .waitForFunction(
+                    (prev) =>
+                      document.querySelectorAll("[data-review-id]").length >
+                      prev,
+                    prevReviewCount,
+                    { timeout: 1500 },
+                  )
+                  .catch(() => {});
               }
 
-              // If we found a section identifier, associate following lines to it till next section
-              const isHeading =
-                l === "Accessibility" ||
-                l === "Amenities" ||
-                l === "Planning" ||
-                l === "Payments" ||
-                l === "About" ||
-                l === "About this data";
-              if (currentSection === "Accessibility" && !isHeading)
-                accessibility.push(l);
-              if (currentSection === "Amenities" && !isHeading)
-                amenities.push(l);
-              if (currentSection === "Planning" && !isHeading) planning.push(l);
-              if (currentSection === "Payments" && !isHeading) payments.push(l);
-
-              if (l === "About this data") break; // End of section
+              // Get Review elements in one in-page pass (up to 20) instead of
+              // one innerText round-trip per review.
+              const reviewTexts = await pane
+                .locator("[data-review-id]")
+                .evaluateAll((els) =>
+                  els.slice(0, 20).map((el) => (el as HTMLElement).innerText),
+                );
+              // Flatten the inner text in the same pass that receives the
+              // batch instead of a second loop over the array.
+              reviewsText = reviewTexts.map((t) => t.replace(/\n+/g, " | "));
             }
+          } catch (e) {
+            log.warn("Failed extracting reviews");
           }
-        } catch (e) {
-          log.warn("Failed extracting about sections");
-        }
 
-        // ---- 5. SAVE DATA ----
-        const data: SalonData = {
-          hash_id: hashId,
-          name,
-          url,
-          ratings: ratingLine || "N/A",
-          address: addressMatch || null,
-          mobile_number: phone,
-          website_link: website,
-          search_tags: searchTags,
-          reviews: reviewsText,
-          accessibility,
-          amenities,
-          planning,
-          payments,
-        };
-
-        await saveSalon(data);
-        scrapedCount++;
-
-        // 6. CLOSING PANE
-        const closeBtn = page.locator('button[aria-label="Close"]').last();
-        if (await closeBtn.isVisible()) {
-          await closeBtn.click();
-          await page.waitForTimeout(800);
-        }
+          // ---- 4. ABOUT TAB DATA ----
+          let accessibility: string[] = [];
+          let amenities: string[] = [];
+          let planning: string[] = [];
+          let payments: string[] = [];
+
+          try {
+            if (aboutVisible) {
+              await aboutTab.click();
+              // Same event-driven pacing as the reviews tab: continue once a
+              // known About heading renders in the pane, capped at 2.5s.
+              await page
+                .waitForFunction(
+                  (headings) => {
+                    const mains =
+                      document.querySelectorAll<HTMLElement>("[role='main']");
+                    const el = mains[mains.length - 1];
+                    if (!el) return false;
+                    const text = el.innerText;
+                    return headings.some((h) => text.includes(h));
+                  },
+                  Array.from(ABOUT_SECTIONS),
+                  { timeout: 2500 },
+                )
+                .catch(() => {});
+
+              const aboutText = await pane.innerText();
+              const aLines = aboutText
+                .split("\n")
+                .map((l) => l.trim())
+                .filter(Boolean);
+
+              let currentSection = "";
+              for (const l of aLines) {
+                if (ABOUT_SECTIONS.has(l)) {
+                  currentSection = l;
+                  continue;
+                }
+
+                // If we found a section identifier, associate following lines to it till next section
+                const isHeading = ABOUT_HEADINGS.has(l);
+                if (currentSection === "Accessibility" && !isHeading)
+                  accessibility.push(l);
+                if (currentSection === "Amenities" && !isHeading)
+                  amenities.push(l);
+                if (currentSection === "Planning" && !isHeading) planning.push(l);
+                if (currentSection === "Payments" && !isHeading) payments.push(l);
+
+                if (l === "About this data") break; // End of section
+              }
+            }
+          } catch (e) {
+            log.warn("Failed extracting about sections");
+          }
 
-        if (scrapedCount >= targetItems) break;
-      } catch (err) {
-        log.warn(`Error extracting data for an article: ${err}`);
-        const closeBtn = page.locator('button[aria-label="Close"]').last();
-        if (await closeBtn.isVisible().catch(() => false)) {
-          await closeBtn.click().catch(() => {});
-          await page.waitForTimeout(800);
+          // ---- 5. SAVE DATA ----
+          const data: SalonData = {
+            hash_id: hashId,
+            name,
+            url,
+            ratings: ratingLine || "N/A",
+            address: addressMatch || null,
+            mobile_number: phone,
+            website_link: website,
+            search_tags: searchTags,
+            reviews: reviewsText,
+            accessibility,
+            amenities,
+            planning,
+            payments,
+          };
+
+          // 6. SAVE + CLOSING PANE — the Postgres write and the pane close
+          // touch independent systems, so they run concurrently; the single
+          // click attempt with a short timeout replaces the separate
+          // visibility probe plus click round-trips.
+          const [, closed] = await Promise.all([
+            saveSalon(data),
+            closeBtn
+              .click({ timeout: 1000 })
+              .then(() => true)
+              .catch(() => false),
+          ]);
+          knownHashes.add(hashId);
+          scrapedCount++;
+          if (closed) {
+            // Continue once the pane is actually gone instead of a flat sleep.
+            await closeBtn
+              .waitFor({ state: "hidden", timeout: 2000 })
+              .catch(() => {});
+          }
+
+          if (scrapedCount >= targetItems) break;
+        } catch (err) {
+          log.warn(`Error extracting data for an article: ${err}`);
+          const closed = await closeBtn
+            .click({ timeout: 1000 })
+            .then(() => true)
+            .catch(() => false);
+          if (closed) {
+            await closeBtn
+              .waitFor({ state: "hidden", timeout: 2000 })
+              .catch(() => {});
+          }
         }
       }
-    }
-
-    if (scrapedCount >= targetItems) {
-      log.info(
-        `Reached target of ${targetItems} newly scraped items. Stopping.`,
-      );
-      break;
-    }
 
-    log.info(`Scraping loop advancing. Attempting to scroll feed...`);
-    await feed.evaluate((el) => {
-      el.scrollTo(0, el.scrollHeight);
-    });
-    await page.waitForTimeout(2500);
-
-    const newCount = await articles.count();
-    if (newCount === previousItemCount) {
-      stagnantScrolls++;
-      if (stagnantScrolls > 4) {
-        log.warn(
-          "No new items loaded after multiple scroll attempts. We may have hit the end of the results.",
+      if (scrapedCount >= targetItems) {
+        log.info(
+          `Reached target of ${targetItems} newly scraped items. Stopping.`,
         );
         break;
       }
-    } else {
-      stagnantScrolls = 0;
+
+      log.info(`Scraping loop advancing. Attempting to scroll feed...`);
+      await feed.evaluate(scrollToBottom);
+
+      // Wait until new result cards actually attach instead of sleeping a
+      // fixed 2.5s; the timeout keeps the old pacing when the feed stalls so
+      // the stagnation counter below still trips.
+      await page
+        .waitForFunction(
+          (prev) => document.querySelectorAll("[role='article']").length > prev,
+          count,
+          { timeout: 2500 },
+        )
+        .catch(() => {});
+
+      const newCount = await articles.count();
+      if (newCount === previousItemCount) {
+        stagnantScrolls++;
+        if (stagnantScrolls > 4) {
+          log.warn(
+            "No new items loaded after multiple scroll attempts. We may have hit the end of the results.",
+          );
+          break;
+        }
+      } else {
+        stagnantScrolls = 0;
+      }
+      previousItemCount = newCount;
     }
-    previousItemCount = newCount;
-  }
 
-  log.info(`Finished scraping run!`);
+    log.info(`Finished scraping run!`);
+  } finally {
+    // The page is shared with other modules; remove the blocker even
+    // when the run throws so interception does not leak into later runs.
+    await page.unroute("**/*").catch(() => {});
+  }
 }
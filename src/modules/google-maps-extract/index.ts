@@ -1,6 +1,6 @@
 import fs from "node:fs";
 import path from "node:path";
-import { createPersistentContext, saveStorageState } from "../../core/context";
+import { acquireSharedContext, saveStorageState } from "../../core/context";
 import { log } from "../../core/logger";
 import { config } from "../../config";
 
@@ -37,7 +37,7 @@ export async function run() {
     log.info(`[${moduleConfig.name}] Starting encapsulated execution...`);
 
     // Boot using shared global profiles
-    context = await createPersistentContext({
+    context = await acquireSharedContext({
       profileDir: config.profileDir,
       storageStatePath: config.storageStatePath,
     });
@@ -56,10 +56,8 @@ export async function run() {
       `[${moduleConfig.name}] Critical error during execution: ${error}`,
     );
   } finally {
-    if (context) {
-      log.info(`[${moduleConfig.name}] Closing local browser context...`);
-      await context.close().catch(() => {});
-    }
+    // The shared context stays warm for the next run (see core/context.ts),
+    // so it is deliberately not closed here.
     _isRunning = false;
   }
 }